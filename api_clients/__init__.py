@@ -42,6 +42,7 @@ from .crossref_client import (
     CrossrefBibliographicClient,
     CrossrefBibliographicFetcher,
     CrossrefConfig,
+    CrossrefQuery,
 )
 
 # Scopus
@@ -50,6 +51,7 @@ from .scopus_client import (
     ScopusSearchFetcher,
     ScopusAbstractFetcher,
     ScopusConfig,
+    set_max_concurrent_requests,
 )
 
 # Utilities
@@ -76,7 +78,9 @@ __all__ = [
     # Configuration
     "APIConfig",
     "CrossrefConfig",
+    "CrossrefQuery",
     "ScopusConfig",
+    "set_max_concurrent_requests",
     
     # Utilities
     "RateLimiter",
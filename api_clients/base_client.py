@@ -12,11 +12,16 @@ This base class provides common functionality for API clients:
 from pathlib import Path
 import requests
 import pandas as pd
+import asyncio
+import contextlib
 import time
 import datetime
+import threading
+import json
+import itertools
 from urllib.parse import quote_plus
-from typing import Optional, Dict, List, Any, Iterator
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Iterator, Container, Callable, AsyncContextManager
+from dataclasses import dataclass, field
 import logging
 from abc import ABC, abstractmethod
 
@@ -24,6 +29,23 @@ from .local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional but decodes large API responses several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a response.
+    
+    Uses orjson when installed, otherwise the standard library. Raises
+    ValueError for invalid JSON, like response.json().
+    """
+    return _json_loads(response.content)
+
 
 @dataclass
 class APIConfig:
@@ -43,9 +65,10 @@ class APIConfig:
     max_results_per_query: int = 5000
     
     # Default parameters (API-specific)
-    default_params: Dict[str, Any] = None
+    default_params: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
+        # Explicitly passing None still means no defaults
         if self.default_params is None:
             self.default_params = {}
 
@@ -53,6 +76,8 @@ class APIConfig:
 class TokenBucket:
     """Token bucket for rate limiting."""
     
+    __slots__ = ('rate', 'capacity', 'tokens', 'last_update', '_lock')
+    
     def __init__(self, rate: float, capacity: int):
         """
         Args:
@@ -63,20 +88,32 @@ class TokenBucket:
         self.capacity = capacity
         self.tokens = capacity
         self.last_update = time.time()
+        self._lock = threading.Lock()
     
-    def consume(self, tokens: int = 1) -> bool:
-        """Attempt to consume tokens. Returns True if successful."""
+    def _refill(self):
+        """Add tokens based on time passed. Caller must hold the lock."""
         now = time.time()
         elapsed = now - self.last_update
-        
-        # Add tokens based on time passed
         self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
         self.last_update = now
-        
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+    
+    def consume(self, tokens: int = 1) -> bool:
+        """Attempt to consume tokens. Returns True if successful."""
+        with self._lock:
+            self._refill()
+            
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+    
+    def set_rate(self, rate: float, capacity: int):
+        """Change refill rate and capacity, keeping tokens earned so far."""
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self.capacity = capacity
+            self.tokens = min(self.tokens, capacity)
     
     def wait_time(self, tokens: int = 1) -> float:
         """Calculate time to wait before tokens are available."""
@@ -89,6 +126,9 @@ class TokenBucket:
 class RateLimiter:
     """Rate limiter that respects both local token bucket and API rate limit headers."""
     
+    # Subclasses should declare __slots__ too (empty unless they add attributes)
+    __slots__ = ('config', 'bucket', 'api_rate_limit', 'api_remaining', 'api_reset_time')
+    
     def __init__(self, config: APIConfig):
         self.config = config
         self.bucket = TokenBucket(config.requests_per_second, config.burst_size)
@@ -117,12 +157,127 @@ class RateLimiter:
         while not self.bucket.consume():
             time.sleep(0.1)
     
+    def set_rate(self, rate: float):
+        """
+        Change the local request rate, e.g. to follow a rate advertised by the API.
+        
+        Burst capacity grows with the rate but is capped at twice the rate,
+        so a higher limit doesn't turn into a large burst of requests.
+        """
+        if rate <= 0:
+            return
+        capacity = max(self.bucket.capacity, int(rate))
+        capacity = max(1, min(capacity, int(2 * rate)))
+        self.bucket.set_rate(rate, capacity)
+    
+    async def acquire_async(self, tokens: int = 1):
+        """
+        Async version of wait_if_needed().
+        
+        Waits with asyncio.sleep, so other tasks on the event loop keep
+        running while this one is rate limited. The bucket is shared with
+        the sync path. No asyncio lock is needed since consume() never
+        awaits between checking and taking tokens.
+        """
+        # First check API rate limits if we have them
+        if self.api_remaining is not None and self.api_remaining < 10:
+            if self.api_reset_time:
+                wait_time = (self.api_reset_time - datetime.datetime.now()).total_seconds()
+                if wait_time > 0:
+                    logger.warning(f"Approaching API rate limit. Waiting {wait_time:.1f}s until reset.")
+                    await asyncio.sleep(wait_time + 1)
+                    return
+        
+        # Then wait for the local token bucket
+        while not self.bucket.consume(tokens):
+            await asyncio.sleep(max(self.bucket.wait_time(tokens), 0.01))
+    
     def update_from_headers(self, headers: Dict[str, str]):
         """Update rate limit state from API response headers (API-specific)."""
         # Default implementation - can be overridden by subclasses
         pass
 
 
+@contextlib.asynccontextmanager
+async def _no_slot():
+    """Async context manager that does nothing (no request slot to hold)."""
+    yield
+
+
+async def _request_json_async(
+    session,
+    url: str,
+    config: APIConfig,
+    rate_limiter: RateLimiter,
+    retry_statuses: Optional[Container[int]] = None,
+    request_slot: Optional[Callable[[], AsyncContextManager]] = None
+) -> Optional[Any]:
+    """
+    GET a JSON document with aiohttp, retrying with exponential backoff.
+    
+    Args:
+        session: aiohttp.ClientSession
+        url: URL to fetch
+        config: Supplies timeout, max_retries and the retry delays
+        rate_limiter: Acquired before every attempt, updated from response headers
+        retry_statuses: HTTP statuses worth retrying; None retries every
+                       error except 400 and 401
+        request_slot: Returns an async context manager held around each
+                     HTTP request only (not rate limiter waits or retry
+                     sleeps), e.g. to limit requests in flight
+    
+    Returns the decoded JSON body, or None if the request fails after all
+    retries. Raises RuntimeError on 401.
+    """
+    import aiohttp
+    
+    timeout = aiohttp.ClientTimeout(total=config.timeout)
+    
+    for retry_count in range(config.max_retries + 1):
+        await rate_limiter.acquire_async()
+        delay = min(
+            config.initial_retry_delay * (config.retry_backoff_factor ** retry_count),
+            config.max_retry_delay
+        )
+        
+        slot = request_slot() if request_slot is not None else _no_slot()
+        try:
+            async with slot, session.get(url, timeout=timeout) as response:
+                rate_limiter.update_from_headers(response.headers)
+                
+                if response.status < 400:
+                    return _json_loads(await response.read())
+                
+                if response.status == 400:
+                    logger.error(f"Bad request (400): {(await response.text())[:200]}")
+                    return None
+                if response.status == 401:
+                    logger.error("Authentication failed (401). Check credentials.")
+                    raise RuntimeError("Invalid credentials or unauthorized access")
+                if retry_statuses is not None and response.status not in retry_statuses:
+                    logger.error(f"Request failed ({response.status}): {url[:100]}")
+                    return None
+                if response.status == 429:
+                    logger.warning("Rate limit exceeded (429). Waiting before retry...")
+                    delay = config.max_retry_delay
+                else:
+                    logger.warning(f"Request failed ({response.status}), attempt {retry_count + 1}/{config.max_retries + 1}")
+        
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {e}")
+            return None
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Request exception: {e!r}, attempt {retry_count + 1}/{config.max_retries + 1}")
+        
+        if retry_count < config.max_retries:
+            logger.info(f"Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+    
+    logger.error(f"Max retries ({config.max_retries}) reached")
+    return None
+
+
 class BaseAPIClient(ABC):
     """
     Base class for API clients with rate limiting, caching, and error handling.
@@ -137,6 +292,8 @@ class BaseAPIClient(ABC):
         self.config = config
         self.rate_limiter = RateLimiter(config)
         self.session = requests.Session()
+        # Per-thread .status: HTTP status of the last attempt (None: no response)
+        self._request_state = threading.local()
         self._setup_session()
     
     @abstractmethod
@@ -168,16 +325,33 @@ class BaseAPIClient(ABC):
         """Get URL for next page from response, or None if no more pages."""
         pass
     
-    def _make_request(self, url: str, retry_count: int = 0) -> Optional[requests.Response]:
+    def _send(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Send one GET request; subclasses can override to wrap every HTTP call."""
+        return self.session.get(url, headers=headers, timeout=self.config.timeout)
+    
+    def _make_request(
+        self,
+        url: str,
+        retry_count: int = 0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
         """
         Make a request with retry logic.
         
-        Returns None if request fails after all retries.
+        Args:
+            url: URL to fetch
+            retry_count: Retries made so far
+            headers: Extra request headers, e.g. If-None-Match for conditional requests
+        
+        Returns None if request fails after all retries. A 304 Not Modified
+        response (to a conditional request) is returned like a success.
         """
         self.rate_limiter.wait_if_needed()
+        self._request_state.status = None
         
         try:
-            response = self.session.get(url, timeout=self.config.timeout)
+            response = self._send(url, headers)
+            self._request_state.status = response.status_code
             self.rate_limiter.update_from_headers(response.headers)
             
             # Log response details for debugging
@@ -197,11 +371,11 @@ class BaseAPIClient(ABC):
             if response.status_code == 429:  # Too Many Requests
                 logger.warning("Rate limit exceeded (429). Waiting before retry...")
                 time.sleep(self.config.max_retry_delay)
-                return self._retry_request(url, retry_count)
+                return self._retry_request(url, retry_count, headers)
             
             elif response.status_code == 500:  # Server Error
                 logger.warning(f"Server error (500). Retry {retry_count + 1}/{self.config.max_retries}")
-                return self._retry_request(url, retry_count)
+                return self._retry_request(url, retry_count, headers)
             
             elif response.status_code == 503:  # Service Unavailable
                 logger.warning(f"Service unavailable (503). Retry {retry_count + 1}/{self.config.max_retries}")
@@ -213,7 +387,7 @@ class BaseAPIClient(ABC):
                 if retry_count < self.config.max_retries:
                     logger.info(f"Waiting {delay:.1f}s before retry...")
                     time.sleep(delay)
-                    return self._make_request(url, retry_count + 1)
+                    return self._make_request(url, retry_count + 1, headers)
                 else:
                     logger.error(f"Max retries ({self.config.max_retries}) reached for 503 error")
                     return None
@@ -228,17 +402,22 @@ class BaseAPIClient(ABC):
             
             else:
                 logger.error(f"Unexpected status code {response.status_code}")
-                return self._retry_request(url, retry_count)
+                return self._retry_request(url, retry_count, headers)
         
         except requests.Timeout:
             logger.warning(f"Request timeout. Retry {retry_count + 1}/{self.config.max_retries}")
-            return self._retry_request(url, retry_count)
+            return self._retry_request(url, retry_count, headers)
         
         except requests.RequestException as e:
             logger.error(f"Request exception: {e}")
-            return self._retry_request(url, retry_count)
+            return self._retry_request(url, retry_count, headers)
     
-    def _retry_request(self, url: str, retry_count: int) -> Optional[requests.Response]:
+    def _retry_request(
+        self,
+        url: str,
+        retry_count: int,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
         """Handle retry logic with exponential backoff."""
         if retry_count >= self.config.max_retries:
             logger.error(f"Max retries ({self.config.max_retries}) reached")
@@ -251,18 +430,31 @@ class BaseAPIClient(ABC):
         logger.info(f"Retrying in {delay:.1f}s...")
         time.sleep(delay)
         
-        return self._make_request(url, retry_count + 1)
+        return self._make_request(url, retry_count + 1, headers)
     
-    def search_iter(self, query: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    def search_iter(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
         Execute a search query and yield pages of results.
         
         Args:
             query: Search query string
             params: Optional parameters to override defaults
+            validators: 'etag' and/or 'last_modified' of a previous fetch; the
+                       first page is then requested conditionally
         
         Yields:
-            Dict containing page data (format defined by _parse_page_response)
+            Dict containing page data (format defined by _parse_page_response).
+            The first page carries the response's 'validators', if any.
+            If a page can't be fetched, a final page with error='request_failed'
+            is yielded and iteration stops; its 'status' is the HTTP status of
+            the last attempt, or None if no response was received. If the server reports the first
+            page unchanged (304), a single page with error='not_modified' is
+            yielded instead.
         """
         # Determine how many rows are requested (for checking if we should enforce limit)
         requested_rows = None
@@ -276,19 +468,37 @@ class BaseAPIClient(ABC):
             page += 1
             logger.info(f"Fetching page {page} for query: {query[:50]}...")
             
-            response = self._make_request(url)
+            headers = self._conditional_headers(validators) if page == 1 else None
+            response = self._make_request(url, headers=headers)
             if response is None:
                 logger.error(f"Failed to fetch page {page}")
+                yield {
+                    'page': page, 'total_results': 0, 'results': None, 'error': 'request_failed',
+                    'status': self._request_state.status
+                }
+                break
+            
+            if response.status_code == 304:
+                logger.info(f"Not modified since last fetch: {query[:50]}")
+                yield {'page': page, 'total_results': 0, 'results': None, 'error': 'not_modified'}
                 break
             
             try:
-                data = response.json()
+                data = parse_json_response(response)
             except ValueError as e:
                 logger.error(f"Invalid JSON response: {e}")
+                yield {
+                    'page': page, 'total_results': 0, 'results': None, 'error': 'request_failed',
+                    'status': response.status_code
+                }
                 break
             
             # Parse using API-specific parser
             page_data = self._parse_page_response(data, page)
+            if page == 1:
+                response_validators = self._response_validators(response)
+                if response_validators:
+                    page_data['validators'] = response_validators
             
             # Check for errors
             if page_data.get('error'):
@@ -297,26 +507,12 @@ class BaseAPIClient(ABC):
                 break
             
             # Check if query exceeds max results
-            # Skip this check if we're only requesting a small number of rows (e.g., <= 10)
-            # This is useful for citation resolution where we only need the top result
-            total_results = page_data.get('total_results', 0)
-            should_check_limit = requested_rows is None or requested_rows > 10
-            
-            if should_check_limit and total_results > self.config.max_results_per_query:
-                logger.warning(
-                    f"Query returned {total_results} results, exceeding max_results_per_query "
-                    f"({self.config.max_results_per_query}). Consider refining your query."
-                )
-                page_data['error'] = 'too_many_results'
+            if self._exceeds_total_limit(page_data, requested_rows):
                 yield page_data
                 break
             
             # Stop iterating if there are no items/results on this page
-            items = page_data.get('results')
-            if items is None:
-                items = page_data.get('items')
-            if isinstance(items, list) and len(items) == 0:
-                logger.info(f"No items on page {page}; stopping pagination.")
+            if self._is_empty_page(page_data):
                 break
             
             yield page_data
@@ -324,6 +520,127 @@ class BaseAPIClient(ABC):
             # Get next page URL
             url = self._get_next_page_url(data, url)
     
+    @staticmethod
+    def _conditional_headers(validators: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Build If-None-Match/If-Modified-Since headers from stored validators."""
+        if not validators:
+            return None
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers or None
+    
+    @staticmethod
+    def _response_validators(response: requests.Response) -> Dict[str, str]:
+        """Extract ETag/Last-Modified from a response (empty if the API sends neither)."""
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        return validators
+    
+    def _exceeds_total_limit(self, page_data: Dict[str, Any], requested_rows: Optional[int]) -> bool:
+        """Check total results against max_results_per_query, marking the page if exceeded."""
+        # Skip this check if we're only requesting a small number of rows (e.g., <= 10)
+        # This is useful for citation resolution where we only need the top result
+        total_results = page_data.get('total_results', 0)
+        should_check_limit = requested_rows is None or requested_rows > 10
+        
+        if should_check_limit and total_results > self.config.max_results_per_query:
+            logger.warning(
+                f"Query returned {total_results} results, exceeding max_results_per_query "
+                f"({self.config.max_results_per_query}). Consider refining your query."
+            )
+            page_data['error'] = 'too_many_results'
+            return True
+        return False
+    
+    @staticmethod
+    def _is_empty_page(page_data: Dict[str, Any]) -> bool:
+        """True if the page has no items, which ends pagination."""
+        items = page_data.get('results')
+        if items is None:
+            items = page_data.get('items')
+        if isinstance(items, list) and len(items) == 0:
+            logger.info(f"No items on page {page_data.get('page')}; stopping pagination.")
+            return True
+        return False
+    
+    async def _make_request_async(self, session, url: str) -> Optional[Any]:
+        """
+        Make an aiohttp request with retry logic.
+        
+        Returns the decoded JSON body, or None if the request fails after all retries.
+        """
+        return await _request_json_async(session, url, self.config, self.rate_limiter)
+    
+    async def fetch_async(self, query: str, params: Optional[Dict[str, Any]] = None, session=None) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages of a query with aiohttp (requires: pip install aiohttp).
+        
+        Async counterpart of search_iter(). Waiting for the rate limiter
+        doesn't block the event loop, so several queries can run together
+        with asyncio.gather, sharing this client's rate limit.
+        
+        Args:
+            query: Search query string
+            params: Optional parameters to override defaults
+            session: Optional aiohttp.ClientSession to reuse; one with this
+                    client's session headers is created if omitted
+        
+        Returns:
+            List of page dicts (format defined by _parse_page_response).
+            If a page can't be fetched, the last page has error='request_failed'.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("fetch_async requires aiohttp - install with: pip install aiohttp")
+        
+        if session is None:
+            async with aiohttp.ClientSession(headers=dict(self.session.headers)) as session:
+                return await self.fetch_async(query, params, session=session)
+        
+        requested_rows = None
+        if params:
+            requested_rows = params.get('rows') or params.get('count')
+        
+        url = self._build_search_url(query, params)
+        pages = []
+        page = 0
+        
+        while url:
+            page += 1
+            logger.info(f"Fetching page {page} for query: {query[:50]}...")
+            
+            data = await self._make_request_async(session, url)
+            if data is None:
+                logger.error(f"Failed to fetch page {page}")
+                pages.append({'page': page, 'total_results': 0, 'results': None, 'error': 'request_failed'})
+                break
+            
+            page_data = self._parse_page_response(data, page)
+            
+            if page_data.get('error'):
+                logger.error(f"API error: {page_data.get('error')}")
+                pages.append(page_data)
+                break
+            
+            if self._exceeds_total_limit(page_data, requested_rows):
+                pages.append(page_data)
+                break
+            
+            if self._is_empty_page(page_data):
+                break
+            
+            pages.append(page_data)
+            url = self._get_next_page_url(data, url)
+        
+        return pages
+    
     def search(self, query: str, params: Optional[Dict[str, Any]] = None, ignore_total_limit: bool = False) -> List[Dict[str, Any]]:
         """
         Execute a search query and return all results.
@@ -370,7 +687,58 @@ class BaseAPIClient(ABC):
         return all_results
 
 
-class BaseSearchFetcher:
+class StaleCacheMixin:
+    """
+    Serve expired cache entries while the upstream API is failing.
+    
+    Once a failed fetch has been answered from stale cache, the key is
+    served from cache without contacting the API for stale_seconds.
+    Classes using this need a self.cache (LocalCache).
+    """
+    
+    # How long to skip the API for a key after serving it stale (seconds)
+    stale_seconds = 300
+    
+    def __init__(self):
+        # Cache key -> time.monotonic() until which stale results are served
+        self._stale_until: Dict[str, float] = {}
+    
+    def _get_stale(self, key: str) -> Optional[Any]:
+        """Cached data for key, expired or not (override to post-process)."""
+        return self.cache.get(key, allow_expired=True)
+    
+    def _recent_stale(self, key: str) -> Optional[Any]:
+        """Stale data for key if the API failed for it within stale_seconds, else None."""
+        if time.monotonic() >= self._stale_until.get(key, 0):
+            return None
+        cached = self._get_stale(key)
+        if cached is not None:
+            logger.info(f"Serving stale cache for {key[:50]} (API failed recently)")
+        return cached
+    
+    def _serve_stale(self, key: str, reason: Any) -> Optional[Any]:
+        """Return stale data for key after a failed fetch (None if not cached) and open the window."""
+        cached = self._get_stale(key)
+        if cached is None:
+            return None
+        logger.warning(f"Serving stale cache for {key[:50]} due to upstream {reason}")
+        self._stale_until[key] = time.monotonic() + self.stale_seconds
+        return cached
+    
+    def _serve_stale_after(self, key: str, status: Optional[int]) -> Optional[Any]:
+        """
+        Like _serve_stale(), for a fetch that failed with HTTP status.
+        
+        Only server errors (5xx) and connection errors (status None) fall
+        back to stale data; other failures such as 400/401/404 return None.
+        """
+        if status is not None and status < 500:
+            return None
+        reason = "connection error" if status is None else f"status {status}"
+        return self._serve_stale(key, reason)
+
+
+class BaseSearchFetcher(StaleCacheMixin):
     """
     Base class for search fetchers with caching.
     
@@ -378,35 +746,69 @@ class BaseSearchFetcher:
     """
     
     def __init__(self, client: BaseAPIClient, cache: LocalCache):
+        super().__init__()
         self.client = client
         self.cache = cache
     
-    def fetch(self, query: str, force_refresh: bool = False, show_progress: bool = True, **params) -> Optional[pd.DataFrame]:
+    def fetch(
+        self,
+        query: str,
+        force_refresh: bool = False,
+        show_progress: bool = True,
+        cache_priority: int = 1,
+        stale_ok: bool = False,
+        **params
+    ) -> Optional[pd.DataFrame]:
         """
         Fetch results for a query, using cache if available.
         
+        Caching is all-or-nothing: results are stored only once every page
+        has been fetched. If a request fails part way, nothing is cached and
+        the next call fetches the query from scratch.
+        
+        Expired cache entries are revalidated when the API sent an ETag or
+        Last-Modified header: the first page is requested conditionally,
+        and if the API reports it unchanged (304) the cached results are
+        kept and marked fresh without downloading the query again.
+        
+        With stale_ok, a fetch that fails with a server error (5xx) or no
+        response at all returns the expired cached results instead of None,
+        and the API is not asked again for this query for stale_seconds.
+        Other failures (e.g. 400, 401, 404) never serve stale results.
+        
         Args:
             query: Query string
             force_refresh: If True, bypass cache
             show_progress: If True, show progress bar (default: True)
+            cache_priority: Cache eviction priority; higher values are kept longer
+                           when the cache is full (default: 1)
+            stale_ok: If True, fall back to expired cached results when the
+                     API fails with 5xx or can't be reached (default: False)
             **params: Additional API-specific parameters to pass to search
         
         Returns:
             DataFrame with columns: ID, page, num_hits, data
         """
-        # Build cache key that includes params
-        cache_key = query
-        if params:
-            # Sort params for consistent cache keys
-            param_str = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
-            cache_key = f"{query}|{param_str}"
+        cache_key = self._make_cache_key(query, params)
         
         # Check cache first
+        validators = None
         if not force_refresh:
             cached = self.cache.get(cache_key)
             if cached is not None:
                 logger.info(f"Cache hit for query: {cache_key[:50]}")
                 return cached
+            
+            # An expired entry can still be reused if the API says it's unchanged
+            meta = self.cache.get_metadata(cache_key)
+            if meta and self.cache.has(cache_key, allow_expired=True):
+                validators = {k: meta[k] for k in ('etag', 'last_modified') if meta.get(k)} or None
+            
+            # The API failed for this query recently; don't hammer it
+            if stale_ok:
+                cached = self._recent_stale(cache_key)
+                if cached is not None:
+                    return cached
         
         logger.info(f"Fetching query: {cache_key[:50]}...")
         
@@ -425,9 +827,27 @@ class BaseSearchFetcher:
         # Fetch from API
         pages = []
         total_results = None
+        response_validators = {}
         
         try:
-            for page_data in self.client.search_iter(query, params if params else None):
+            for page_data in self.client.search_iter(query, params if params else None, validators=validators):
+                if page_data.get('error') == 'request_failed':
+                    # Partial results are discarded rather than cached
+                    logger.error(f"Error fetching query: request for page {page_data['page']} failed")
+                    if stale_ok:
+                        return self._serve_stale_after(cache_key, page_data.get('status'))
+                    return None
+                
+                if page_data.get('error') == 'not_modified':
+                    cached = self.cache.get(cache_key, allow_expired=True)
+                    if cached is None:
+                        raise RuntimeError("cached results of unchanged query could not be read")
+                    self.cache.touch(cache_key)
+                    return cached
+                
+                if page_data.get('validators'):
+                    response_validators = page_data['validators']
+                
                 # Initialize progress bar on first page (when we know total)
                 if pbar is None and tqdm_available and page_data.get('total_results'):
                     total_results = page_data['total_results']
@@ -443,13 +863,7 @@ class BaseSearchFetcher:
                         leave=True
                     )
                 
-                pages.append({
-                    'ID': cache_key,
-                    'page': page_data['page'],
-                    'num_hits': page_data['total_results'],
-                    'data': page_data.get('results'),
-                    'error': page_data.get('error')
-                })
+                pages.append(self._page_row(cache_key, page_data))
                 
                 # Update progress bar
                 if pbar is not None and page_data.get('results'):
@@ -457,36 +871,73 @@ class BaseSearchFetcher:
                 
                 # Handle errors
                 if page_data.get('error'):
-                    if page_data.get('error') == 'too_many_results':
-                        logger.warning(
-                            f"Query returned {page_data['total_results']} results, "
-                            f"exceeding max_hits ({self.client.config.max_results_per_query})"
-                        )
-                        pages[-1]['data'] = None
                     break
         
         except Exception as e:
+            # Partial results are discarded rather than cached
             logger.error(f"Error fetching query: {e}")
             return None
         
+        else:
+            if not pages:
+                logger.warning(f"No results for query: {cache_key[:50]}")
+                return None
+            
+            return self._store_pages(cache_key, pages, cache_priority, **response_validators)
+        
         finally:
             # Close progress bar
             if pbar is not None:
                 pbar.close()
-        
-        if not pages:
-            logger.warning(f"No results for query: {cache_key[:50]}")
-            return None
-        
-        # Store in cache
+    
+    @staticmethod
+    def _make_cache_key(query: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a query, including any params."""
+        if not params:
+            return query
+        # Sort params for consistent cache keys
+        param_str = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{query}|{param_str}"
+    
+    def _page_row(self, cache_key: str, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a page dict from the client into a cached result row."""
+        row = {
+            'ID': cache_key,
+            'page': page_data['page'],
+            'num_hits': page_data['total_results'],
+            'data': page_data.get('results'),
+            'error': page_data.get('error')
+        }
+        if row['error'] == 'too_many_results':
+            logger.warning(
+                f"Query returned {page_data['total_results']} results, "
+                f"exceeding max_hits ({self.client.config.max_results_per_query})"
+            )
+            row['data'] = None
+        return row
+    
+    def _store_pages(
+        self,
+        cache_key: str,
+        pages: List[Dict[str, Any]],
+        cache_priority: int = 1,
+        **meta_kwargs
+    ) -> pd.DataFrame:
+        """Cache the rows of a completely fetched query and return them as a DataFrame."""
         df = pd.DataFrame(pages)
         self.cache.store(
             cache_key,
             df,
+            priority=cache_priority,
+            **meta_kwargs,
             total_results=pages[0]['num_hits'],
-            num_pages=len(pages)
+            num_pages=len(pages),
+            # Summary so cache maintenance can work from metadata alone
+            max_null_data_hits=max(
+                (page['num_hits'] or 0 for page in pages if page['data'] is None),
+                default=0
+            )
         )
-        
         return df
     
     def provide(self, queries: List[str], force_refresh: bool = False, show_progress: bool = True) -> pd.DataFrame:
@@ -605,26 +1056,20 @@ class BaseSearchFetcher:
             - Returns empty DataFrame if no items found
             - Works with any API (Crossref, Scopus, etc.)
         """
-        all_items = []
+        if 'data' not in results.columns:
+            return pd.DataFrame()
         
-        # Extract all items from all pages
-        for idx, row in results.iterrows():
-            data = row.get('data')
-            
-            # Skip if no data or empty
-            if data is None:
-                continue
-            
-            if isinstance(data, list):
-                if len(data) > 0:
-                    all_items.extend(data)
-            else:
-                # Single item (edge case)
-                all_items.append(data)
+        # Flatten the per-page lists lazily; pages without data are skipped
+        # and a non-list value is a single item (edge case)
+        all_items = list(itertools.chain.from_iterable(
+            data if isinstance(data, list) else [data]
+            for data in results['data']
+            if data is not None
+        ))
         
         # Return empty DataFrame if no items
         if not all_items:
             return pd.DataFrame()
         
-        # Convert to DataFrame
-        return pd.DataFrame(all_items)
+        # Build the DataFrame once from all records
+        return pd.DataFrame.from_records(all_items)
@@ -10,19 +10,153 @@ Handles Crossref-specific:
 """
 
 from pathlib import Path
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
-from urllib.parse import quote_plus, urlencode
+from typing import Optional, Dict, List, Any, Tuple, Union
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+from urllib.parse import quote_plus, urlencode, urlsplit, urlunsplit, parse_qsl
+import functools
 import logging
+import operator
+import os
+import re
 import pandas as pd
 import yaml
+from requests.adapters import HTTPAdapter
 
-from .base_client import BaseAPIClient, APIConfig, RateLimiter, BaseSearchFetcher
+from .base_client import BaseAPIClient, APIConfig, RateLimiter, BaseSearchFetcher, parse_json_response
 from .local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _read_email_file(path: str, mtime_ns: int) -> Tuple[bool, Optional[str]]:
+    """
+    Parse a crossref.yaml file.
+    
+    Cached on path and modification time, so the file is only re-parsed
+    after it changes.
+    
+    Returns:
+        (decided, email) - decided is False if the file has no usable
+        setting and the next candidate file should be tried
+    """
+    with open(path, 'r') as f:
+        key_data = yaml.safe_load(f)
+    
+    # Handle empty file (None)
+    if key_data is None:
+        logger.info(f"Found {path} but it's empty - using public pool")
+        return True, None
+    
+    # Check for email fields
+    email = key_data.get('mailto') or key_data.get('email')
+    
+    if email and isinstance(email, str) and '@' in email:
+        logger.info(f"Loaded Crossref email from {path}")
+        return True, email
+    elif email is None or email == '':
+        # Explicitly set to None/empty - user wants public pool
+        logger.info(f"Found {path} with empty email - using public pool")
+        return True, None
+    
+    return False, None
+
+
+def _load_crossref_email(api_key_dir: str) -> Optional[str]:
+    """Find crossref.yaml in the current directory or api_key_dir and return its email."""
+    api_key_dir = Path(api_key_dir).expanduser()
+    key_paths = [
+        Path('.') / 'crossref.yaml',
+        api_key_dir / 'crossref.yaml',
+    ]
+    
+    for path in key_paths:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        
+        try:
+            decided, email = _read_email_file(os.path.abspath(path), mtime_ns)
+        except Exception as e:
+            logger.warning(f"Error loading {path}: {e}")
+            continue
+        
+        if decided:
+            return email
+    
+    # No config found - this is fine for Crossref!
+    logger.info("No crossref.yaml found - using public pool (works fine, just slower)")
+    return None
+
+
+# Filter names accepted by the Crossref /works endpoint
+_VALID_FILTER_KEYS = frozenset({
+    'has-funder', 'funder', 'has-funder-doi', 'funder-doi-asserted-by',
+    'location', 'prefix', 'member', 'doi', 'issn', 'isbn', 'type', 'type-name',
+    'container-title', 'category-name', 'group-title', 'directory', 'article-number',
+    'alternative-id', 'orcid', 'has-orcid', 'has-authenticated-orcid',
+    'has-abstract', 'has-affiliation', 'has-description', 'has-references',
+    'reference-visibility', 'has-archive', 'archive',
+    'has-license', 'license.url', 'license.version', 'license.delay',
+    'has-full-text', 'full-text.version', 'full-text.type', 'full-text.application',
+    'updates', 'is-update', 'has-update', 'update-type', 'has-update-policy',
+    'award.number', 'award.funder', 'has-assertion', 'assertion-group', 'assertion',
+    'has-clinical-trial-number', 'clinical-trial-number',
+    'content-domain', 'has-content-domain', 'has-domain-restriction',
+    'has-relation', 'relation.type', 'relation.object', 'relation.object-type',
+    'has-event', 'has-ror-id', 'ror-id',
+    'from-index-date', 'until-index-date', 'from-deposit-date', 'until-deposit-date',
+    'from-update-date', 'until-update-date', 'from-created-date', 'until-created-date',
+    'from-pub-date', 'until-pub-date', 'from-online-pub-date', 'until-online-pub-date',
+    'from-print-pub-date', 'until-print-pub-date', 'from-posted-date', 'until-posted-date',
+    'from-accepted-date', 'until-accepted-date', 'from-issued-date', 'until-issued-date',
+    'from-awarded-date', 'until-awarded-date', 'from-approved-date', 'until-approved-date',
+    'from-event-start-date', 'until-event-start-date',
+    'from-event-end-date', 'until-event-end-date',
+})
+
+# key:value[,key:value...] - values can't contain commas
+_FILTER_RE = re.compile(r'^[a-z.-]+:[^,]+(?:,[a-z.-]+:[^,]+)*$')
+
+# Pulls the fields _parse_page_response needs in one call (KeyError if any is missing)
+_get_msg_fields = operator.itemgetter('total-results', 'items', 'next-cursor')
+
+# Result of a page without items (end of cursor pagination or no hits)
+_EMPTY_PAGE = {'page': -1, 'total_results': 0, 'results': [], 'cursor': None}
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _compile_filter(items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """
+    Build a Crossref filter string (key:value,key:value) from filter items.
+    
+    Items are (key, type(value), value). The type is part of the cache key
+    because True == 1 == 1.0 hash alike but format differently; typed=True
+    alone only covers the top-level argument, not values inside the tuple.
+    """
+    filter_strs = []
+    for key, _, value in items:
+        if isinstance(value, bool):
+            value = str(value).lower()
+        filter_strs.append(f"{key}:{value}")
+    return ','.join(filter_strs)
+
+
+def _ends_recently(filters: Dict[str, Any]) -> bool:
+    """True if an until-*-date filter reaches yesterday or later, so results will soon be stale."""
+    yesterday = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+    for key, value in filters.items():
+        if key.startswith('until-') and key.endswith('-date'):
+            value = str(value)
+            # Dates may be YYYY, YYYY-MM or YYYY-MM-DD
+            if value >= yesterday[:len(value)]:
+                return True
+    return False
+
+
 @dataclass
 class CrossrefConfig(APIConfig):
     """Crossref-specific configuration."""
@@ -38,15 +172,49 @@ class CrossrefConfig(APIConfig):
     # Crossref-specific defaults
     rows_per_page: int = 100  # Crossref uses 'rows' not 'count'
     
+    # Connection pool size for the shared HTTPS session
+    pool_maxsize: int = 20
+    
     def __post_init__(self):
         super().__post_init__()
         if not self.default_params:
             self.default_params = {'rows': self.rows_per_page}
 
 
+@dataclass
+class CrossrefQuery:
+    """
+    Structured Crossref field query.
+    
+    Each non-empty field is sent as its own query.<field> parameter and
+    URL-encoded properly, so text containing '&', '=' or '+' is safe.
+    
+    Usage:
+        query = CrossrefQuery(title="neural networks", author="Smith")
+        results = crossref.fetch(query)
+    """
+    title: str = ""
+    author: str = ""
+    affiliation: str = ""
+    container_title: str = ""
+    publisher_name: str = ""
+    editor: str = ""
+    bibliographic: str = ""
+    
+    def to_params(self) -> Dict[str, str]:
+        """Return the non-empty fields as Crossref query.* parameters."""
+        return {
+            f"query.{key.replace('_', '-')}": value
+            for key, value in asdict(self).items()
+            if value
+        }
+
+
 class CrossrefRateLimiter(RateLimiter):
     """Crossref-specific rate limiter."""
     
+    __slots__ = ()
+    
     def update_from_headers(self, headers: Dict[str, str]):
         """Update rate limit state from Crossref API headers."""
         try:
@@ -55,10 +223,12 @@ class CrossrefRateLimiter(RateLimiter):
                 self.api_rate_limit = int(headers['X-Rate-Limit-Limit'])
             if 'X-Rate-Limit-Interval' in headers:
                 interval_seconds = int(headers['X-Rate-Limit-Interval'].rstrip('s'))
-                # Calculate requests per second
-                if interval_seconds > 0:
+                # Calculate requests per second and follow it
+                if interval_seconds > 0 and self.api_rate_limit:
                     rate = self.api_rate_limit / interval_seconds
-                    logger.debug(f"Crossref rate limit: {self.api_rate_limit} requests per {interval_seconds}s ({rate:.1f}/s)")
+                    if rate != self.bucket.rate:
+                        logger.debug(f"Crossref rate limit: {self.api_rate_limit} requests per {interval_seconds}s ({rate:.1f}/s)")
+                        self.set_rate(rate)
         except (ValueError, KeyError) as e:
             logger.warning(f"Error parsing Crossref rate limit headers: {e}")
 
@@ -68,8 +238,14 @@ class CrossrefSearchClient(BaseAPIClient):
     
     def __init__(self, config: CrossrefConfig):
         self.config = config
-        self.rate_limiter = CrossrefRateLimiter(config)
+        
+        # Parameters that don't change between queries are encoded once
+        self._base_prefix = f"{config.base_url}?{urlencode(config.default_params)}"
+        self._mailto_frag = f"&mailto={quote_plus(config.mailto)}" if config.mailto else ""
+        
         super().__init__(config)
+        # Set after the base constructor, which installs a generic RateLimiter
+        self.rate_limiter = CrossrefRateLimiter(config)
     
     def _setup_session(self):
         """Setup Crossref session with polite pool headers."""
@@ -82,6 +258,16 @@ class CrossrefSearchClient(BaseAPIClient):
             'Accept': 'application/json',
         })
         
+        # Keep connections to api.crossref.org alive across requests so repeated
+        # lookups don't pay a new TCP+TLS handshake each time. Retries are
+        # handled by _make_request, so the adapter itself doesn't retry.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount('https://', adapter)
+        
         if self.config.mailto:
             logger.info(f"Crossref client using polite pool (mailto: {self.config.mailto})")
         else:
@@ -96,23 +282,25 @@ class CrossrefSearchClient(BaseAPIClient):
         - Field query: "query.title=machine learning"
         - Filter query: using filters parameter
         """
-        url_params = {**self.config.default_params, **(params or {})}
+        # Common case: no extra params, only query and cursor vary
+        if not params:
+            return f"{self._base_prefix}{self._mailto_frag}&query={quote_plus(query)}&cursor=*"
         
-        # Add query
-        url_params['query'] = query
+        url_params = {**self.config.default_params, **params}
         
-        # Add mailto if provided and not already in params
-        if self.config.mailto and 'mailto' not in url_params:
-            url_params['mailto'] = self.config.mailto
+        # Add query (may be empty when only query.* field params are given)
+        if query:
+            url_params['query'] = query
         
         # Add cursor=* for initial request to enable cursor-based pagination
         # The API requires cursor=* in the initial request to return next-cursor
         if 'cursor' not in url_params:
             url_params['cursor'] = '*'
         
-        # Build URL
+        # Build URL, adding the pre-encoded mailto unless params override it
         param_str = urlencode(url_params)
-        return f"{self.config.base_url}?{param_str}"
+        mailto_frag = '' if 'mailto' in url_params else self._mailto_frag
+        return f"{self.config.base_url}?{param_str}{mailto_frag}"
     
     def _parse_page_response(self, response_data: Dict[str, Any], page: int) -> Dict[str, Any]:
         """Parse Crossref API response."""
@@ -135,11 +323,15 @@ class CrossrefSearchClient(BaseAPIClient):
             }
         
         message = response_data['message']
-        total_results = message.get('total-results', 0)
-        items = message.get('items', [])
+        try:
+            total_results, items, cursor = _get_msg_fields(message)
+        except KeyError:
+            total_results = message.get('total-results', 0)
+            items = message.get('items', [])
+            cursor = message.get('next-cursor', None)
         
-        # Get cursor for next page
-        cursor = message.get('next-cursor', None)
+        if not items:
+            return {**_EMPTY_PAGE, 'page': page, 'total_results': total_results}
         
         return {
             'page': page,
@@ -149,29 +341,23 @@ class CrossrefSearchClient(BaseAPIClient):
         }
     
     def _get_next_page_url(self, response_data: Dict[str, Any], current_url: str) -> Optional[str]:
-        """Get next page URL from Crossref response using cursor."""
+        """
+        Get next page URL from Crossref response using cursor.
+        
+        Only called after a page with items; empty pages already end
+        pagination (see _parse_page_response and search_iter).
+        """
         if 'message' not in response_data:
             return None
         
-        message = response_data['message']
-        next_cursor = message.get('next-cursor')
-        items = message.get('items', [])
-        
-        if not items or len(items) == 0:
-            return None
+        next_cursor = response_data['message'].get('next-cursor')
         
         if next_cursor:
-            # Remove old cursor if present
-            if 'cursor=' in current_url:
-                # Split URL into base and params properly
-                base, params = current_url.split('?', 1)
-                # Remove cursor param
-                param_parts = params.split('&')
-                param_parts = [p for p in param_parts if not p.startswith('cursor=')]
-                current_url = f"{base}?{'&'.join(param_parts)}"
-            
-            # Add new cursor
-            return f"{current_url}&cursor={next_cursor}"
+            # Replace the cursor parameter (cursors may contain '+', '/', '=')
+            parts = urlsplit(current_url)
+            query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
+            query_params['cursor'] = next_cursor
+            return urlunsplit(parts._replace(query=urlencode(query_params)))
         
         return None
 
@@ -496,38 +682,7 @@ class CrossrefBibliographicFetcher:
     
     def _load_email(self, api_key_dir: str) -> Optional[str]:
         """Load email from YAML config file (same as CrossrefSearchFetcher)."""
-        import yaml
-        
-        api_key_dir = Path(api_key_dir).expanduser()
-        key_paths = [
-            Path('.') / 'crossref.yaml',
-            api_key_dir / 'crossref.yaml',
-        ]
-        
-        for path in key_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        key_data = yaml.safe_load(f)
-                        
-                        if key_data is None:
-                            logger.info(f"Found {path} but it's empty - using public pool")
-                            return None
-                        
-                        email = key_data.get('mailto') or key_data.get('email')
-                        
-                        if email and isinstance(email, str) and '@' in email:
-                            logger.info(f"Loaded Crossref email from {path}")
-                            return email
-                        elif email is None or email == '':
-                            logger.info(f"Found {path} with empty email - using public pool")
-                            return None
-                        
-                except Exception as e:
-                    logger.warning(f"Error loading {path}: {e}")
-        
-        logger.info("No crossref.yaml found - using public pool (works fine, just slower)")
-        return None
+        return _load_crossref_email(api_key_dir)
     
     def resolve(
         self, 
@@ -1015,7 +1170,7 @@ class CrossrefBibliographicFetcher:
         try:
             response = self.client._make_request(url)
             if response and response.ok:
-                data = response.json()
+                data = parse_json_response(response)
                 if 'message' in data:
                     metadata = data['message']
                     
@@ -1044,6 +1199,10 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
     
     Main interface for Crossref searches. Use this as the default.
     
+    The cache is all-or-nothing: a query is cached only after all of its
+    cursor pages were fetched, so an interrupted query is never served
+    partially from cache.
+    
     Usage:
         # Simple (auto-loads email from config)
         crossref = CrossrefSearchFetcher()
@@ -1071,6 +1230,7 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
                 - max_results_per_query: Max results (default: 10000)
                 - max_retries: Retry attempts (default: 3)
                 - cache_max_age_days: Cache expiration (default: None/never)
+                - cache_size_bytes: Evict least recently used entries above this size (default: 8 GiB)
                 - rows_per_page: Results per page (default: 100)
         """
         # Load email if not provided
@@ -1098,7 +1258,8 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
         cache = LocalCache(
             cache_dir=cache_dir,
             compression=True,
-            max_age_days=kwargs.get('cache_max_age_days', None)
+            max_age_days=kwargs.get('cache_max_age_days', None),
+            max_size_bytes=kwargs.get('cache_size_bytes', 8 * 1024 ** 3),
         )
         
         super().__init__(client, cache)
@@ -1112,42 +1273,7 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
         Email is optional - Crossref works fine without it (just slower).
         File: crossref.yaml with optional 'mailto' or 'email' field
         """
-        import yaml
-        
-        api_key_dir = Path(api_key_dir).expanduser()
-        key_paths = [
-            Path('.') / 'crossref.yaml',
-            api_key_dir / 'crossref.yaml',
-        ]
-        
-        for path in key_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        key_data = yaml.safe_load(f)
-                        
-                        # Handle empty file (None)
-                        if key_data is None:
-                            logger.info(f"Found {path} but it's empty - using public pool")
-                            return None
-                        
-                        # Check for email fields
-                        email = key_data.get('mailto') or key_data.get('email')
-                        
-                        if email and isinstance(email, str) and '@' in email:
-                            logger.info(f"Loaded Crossref email from {path}")
-                            return email
-                        elif email is None or email == '':
-                            # Explicitly set to None/empty - user wants public pool
-                            logger.info(f"Found {path} with empty email - using public pool")
-                            return None
-                        
-                except Exception as e:
-                    logger.warning(f"Error loading {path}: {e}")
-        
-        # No config found - this is fine for Crossref!
-        logger.info("No crossref.yaml found - using public pool (works fine, just slower)")
-        return None
+        return _load_crossref_email(api_key_dir)
     
     def search_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
         """
@@ -1159,18 +1285,17 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
         Returns:
             Metadata dict or None if not found
         """
-        import requests
-        
-        url = f"https://api.crossref.org/works/{doi}"
+        url = f"{self.client.config.base_url}/{doi}"
         
         # Add mailto if available
         if self.client.config.mailto:
-            url += f"?mailto={self.client.config.mailto}"
+            url += f"?mailto={quote_plus(self.client.config.mailto)}"
         
+        # Goes through the client's pooled session (and rate limiter)
         try:
             response = self.client._make_request(url)
             if response and response.ok:
-                data = response.json()
+                data = parse_json_response(response)
                 if 'message' in data:
                     return data['message']
         except Exception as e:
@@ -1178,11 +1303,36 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
         
         return None
     
+    def search_by_dois(self, dois: List[str], max_workers: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch metadata for several DOIs concurrently.
+        
+        Lookups run in a thread pool sharing the client's pooled session.
+        The rate limiter still spaces out requests, so this overlaps network
+        round trips without exceeding requests_per_second.
+        
+        Args:
+            dois: List of DOI strings
+            max_workers: Number of concurrent lookups (default: requests_per_second,
+                        at most 10; never more than the connection pool size)
+        
+        Returns:
+            List of metadata dicts (None for DOIs not found), in input order
+        """
+        config = self.client.config
+        if max_workers is None:
+            max_workers = min(10, max(1, int(config.requests_per_second)))
+        max_workers = max(1, min(max_workers, config.pool_maxsize))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.search_by_doi, dois))
+    
     def search_with_filters(
         self, 
         query: str, 
         filters: Optional[Dict[str, Any]] = None,
         force_refresh: bool = False,
+        cache_priority: Optional[int] = None,
         **kwargs
     ) -> Optional[pd.DataFrame]:
         """
@@ -1196,40 +1346,63 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
                 - {'from-pub-date': '2020-01-01', 'until-pub-date': '2024-12-31'}
                 - {'type': 'journal-article'}
             force_refresh: If True, bypass cache
+            cache_priority: Cache eviction priority (default: 0 if a date range
+                           ends yesterday or later, since those results go stale
+                           quickly; otherwise 1)
             **kwargs: Additional search parameters
         
         Returns:
             DataFrame with results
-        """
-        import pandas as pd
         
+        Raises:
+            ValueError: If a filter name is unknown or a value is malformed,
+                        so the request isn't sent only to get a 400 back
+        """
         params = kwargs.copy()
         
-        # Add filters
+        # Add filters (Crossref uses filter=key:value,key:value format).
+        # Order is kept as given so cache keys of earlier queries still match.
         if filters:
-            # Crossref uses filter=key:value,key:value format
-            filter_strs = []
-            for key, value in filters.items():
-                if isinstance(value, bool):
-                    value = str(value).lower()
-                filter_strs.append(f"{key}:{value}")
+            items = tuple((key, type(value), value) for key, value in filters.items())
+            try:
+                params['filter'] = _compile_filter(items)
+            except TypeError:
+                # Unhashable filter values can't use the memoised version
+                params['filter'] = _compile_filter.__wrapped__(items)
             
-            if filter_strs:
-                params['filter'] = ','.join(filter_strs)
+            unknown = [key for key in filters if key not in _VALID_FILTER_KEYS]
+            if unknown:
+                raise ValueError(f"Unknown Crossref filter(s): {', '.join(unknown)}")
+            if not _FILTER_RE.match(params['filter']):
+                raise ValueError(
+                    f"Malformed Crossref filter '{params['filter']}' "
+                    f"(expected key:value pairs; values can't be empty or contain commas)"
+                )
+        
+        if cache_priority is None:
+            cache_priority = 0 if filters and _ends_recently(filters) else 1
         
         # Use inherited fetch method with params
-        return self.fetch(query, force_refresh=force_refresh, **params)
+        return self.fetch(query, force_refresh=force_refresh, cache_priority=cache_priority, **params)
     
-    def fetch(self, query: str, force_refresh: bool = False, **params) -> Optional[pd.DataFrame]:
+    def fetch(
+        self,
+        query: Union[str, CrossrefQuery],
+        force_refresh: bool = False,
+        cache_priority: int = 1,
+        **params
+    ) -> Optional[pd.DataFrame]:
         """
         Fetch Crossref search results with optional parameters.
         
         Args:
-            query: Search query (text or field query)
+            query: Search query text, or a CrossrefQuery for field queries
             force_refresh: If True, bypass cache
+            cache_priority: Cache eviction priority; higher values are kept longer
+                           when the cache is full (default: 1)
             **params: Additional Crossref API parameters
         
-        Query Fields (use as 'query.field=value'):
+        Query Fields (set via CrossrefQuery, e.g. CrossrefQuery(container_title=...)):
             query.title           - Search in title
             query.author          - Search in author names
             query.affiliation     - Search in affiliations
@@ -1251,8 +1424,8 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
             until-online-pub-date- Online published on or before
             issn                 - Journal ISSN
             isbn                 - Book ISBN
-            publisher            - Publisher name
-            funder               - Funder name
+            member               - Crossref member (publisher) ID
+            funder               - Funder ID
             
         Common Parameters:
             rows: int            - Results per page (default: 100, max: 1000)
@@ -1277,8 +1450,8 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
             results = fetcher.fetch("machine learning")
             
             # Field search
-            results = fetcher.fetch("query.title=neural networks")
-            results = fetcher.fetch("query.author=Smith")
+            results = fetcher.fetch(CrossrefQuery(title="neural networks"))
+            results = fetcher.fetch(CrossrefQuery(author="Smith"))
             
             # With filters (use helper method)
             results = fetcher.search_with_filters(
@@ -1303,7 +1476,7 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
             
             # Multiple field search
             results = fetcher.fetch(
-                "query.title=climate query.author=Smith"
+                CrossrefQuery(title="climate", author="Smith")
             )
         
         Returns:
@@ -1313,8 +1486,16 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
             https://api.crossref.org/swagger-ui/index.html
             https://github.com/CrossRef/rest-api-doc
         """
+        # Field queries become query.* params; the plain query stays empty
+        if isinstance(query, CrossrefQuery):
+            field_params = query.to_params()
+            if not field_params:
+                raise ValueError("CrossrefQuery has no fields set")
+            params = {**field_params, **params}
+            query = ""
+        
         # Use base fetch with params
-        return super().fetch(query, force_refresh=force_refresh, **params)
+        return super().fetch(query, force_refresh=force_refresh, cache_priority=cache_priority, **params)
 
 
     def expand(
@@ -1409,19 +1590,21 @@ class CrossrefSearchFetcher(BaseSearchFetcher):
 
 # Convenience functions for common Crossref queries
 
-def search_by_title(title: str, mailto: str, **kwargs) -> Optional[pd.DataFrame]:
+def search_by_title(title: str, mailto: str, cache_priority: int = 1, **kwargs) -> Optional[pd.DataFrame]:
     """Search Crossref by title."""
     fetcher = CrossrefSearchFetcher(mailto=mailto, **kwargs)
-    return fetcher.fetch(f"query.title={title}")
+    return fetcher.fetch(CrossrefQuery(title=title), cache_priority=cache_priority)
 
 
-def search_by_author(author: str, mailto: str, **kwargs) -> Optional[pd.DataFrame]:
+def search_by_author(author: str, mailto: str, cache_priority: int = 1, **kwargs) -> Optional[pd.DataFrame]:
     """Search Crossref by author name."""
     fetcher = CrossrefSearchFetcher(mailto=mailto, **kwargs)
-    return fetcher.fetch(f"query.author={author}")
+    return fetcher.fetch(CrossrefQuery(author=author), cache_priority=cache_priority)
 
 
-def search_journal_articles(query: str, mailto: str, **kwargs) -> Optional[pd.DataFrame]:
+def search_journal_articles(query: str, mailto: str, cache_priority: Optional[int] = None, **kwargs) -> Optional[pd.DataFrame]:
     """Search for journal articles only."""
     fetcher = CrossrefSearchFetcher(mailto=mailto, **kwargs)
-    return fetcher.search_with_filters(query, filters={'type': 'journal-article'}, **kwargs)
+    return fetcher.search_with_filters(
+        query, filters={'type': 'journal-article'}, cache_priority=cache_priority, **kwargs
+    )
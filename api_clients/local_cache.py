@@ -6,10 +6,13 @@ Much simpler, faster, and more portable than database storage.
 
 Features:
 - Automatic directory management
-- Efficient pickle storage with compression
+- Efficient pickle storage with compression (zstd if installed, else gzip)
 - Metadata tracking (fetch time, query params)
 - Easy inspection and debugging
 - Optional cache expiration
+- Optional size limit with priority-aware least-recently-used eviction
+- Batched writes of many small entries into one file (store_many)
+- JSON storage for plain dict/list data (store_raw), no pickle or pandas
 """
 
 from pathlib import Path
@@ -21,6 +24,23 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Union
 import hashlib
 import logging
+import os
+
+# zstandard is optional; it compresses much faster than gzip at a similar ratio
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# orjson is optional; it (de)serializes JSON several times faster
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -38,23 +58,31 @@ class LocalCache:
         cache_dir: Union[str, Path] = "~/.cache/scopus_data",
         compression: bool = True,
         max_age_days: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
     ):
         """
         Initialize local cache.
         
         Args:
             cache_dir: Directory for cache files
-            compression: Use gzip compression (recommended)
+            compression: Compress cache files (recommended); zstd if the
+                        zstandard package is installed, otherwise gzip
             max_age_days: Expire cache entries after this many days (None = never expire)
+            max_size_bytes: Evict least recently used entries when the cache
+                           grows beyond this size (None = no limit)
         """
         self.cache_dir = Path(cache_dir).expanduser()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.compression = compression
         self.max_age_days = max_age_days
+        self.max_size_bytes = max_size_bytes
         
         # Metadata file tracks all cached queries
         self.metadata_file = self.cache_dir / "_metadata.json"
         self._load_metadata()
+        
+        # Last batch file read by get(), as (file name, {query: data})
+        self._batch_memo: Optional[tuple] = None
     
     def _load_metadata(self):
         """Load metadata about cached items."""
@@ -63,6 +91,9 @@ class LocalCache:
                 self.metadata = json.load(f)
         else:
             self.metadata = {}
+        
+        # Running total of size_bytes over all entries, kept up to date on store/remove
+        self._total_size = sum(self._entry_size(key) for key in self.metadata)
     
     def _save_metadata(self):
         """Save metadata to disk."""
@@ -84,19 +115,63 @@ class LocalCache:
         return f"{safe_query}_{query_hash}"
     
     def _get_cache_path(self, cache_key: str) -> Path:
-        """Get path for a cache file."""
+        """Get path of the cache file for an existing entry."""
+        meta = self.metadata.get(cache_key)
+        if meta and 'file' in meta:
+            return self.cache_dir / meta['file']
+        
+        # Entries written before file names were recorded
         ext = ".pkl.gz" if self.compression else ".pkl"
         return self.cache_dir / f"{cache_key}{ext}"
     
-    def has(self, query: str) -> bool:
-        """Check if query is in cache and not expired."""
+    def _new_cache_path(self, cache_key: str, fmt: str = "pkl") -> Path:
+        """Get path for writing a cache file (fmt 'pkl' or 'json') with the preferred compression."""
+        if not self.compression:
+            ext = f".{fmt}"
+        elif zstandard is not None:
+            ext = f".{fmt}.zst"
+        else:
+            ext = f".{fmt}.gz"
+        return self.cache_dir / f"{cache_key}{ext}"
+    
+    @staticmethod
+    def _is_json(path: Path) -> bool:
+        """Whether a cache file holds JSON (store_raw) rather than a pickle."""
+        return '.json' in path.suffixes
+    
+    @staticmethod
+    def _read_file(path: Path) -> bytes:
+        """Read a cache file, decompressing based on its suffix."""
+        payload = path.read_bytes()
+        if path.suffix == '.zst':
+            if zstandard is None:
+                raise RuntimeError(f"zstandard is required to read {path.name}")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if path.suffix == '.gz':
+            return gzip.decompress(payload)
+        return payload
+    
+    @staticmethod
+    def _write_file(path: Path, payload: bytes):
+        """Write a cache file atomically, compressing based on its suffix."""
+        if path.suffix == '.zst':
+            payload = zstandard.ZstdCompressor(level=3).compress(payload)
+        elif path.suffix == '.gz':
+            payload = gzip.compress(payload)
+        
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    
+    def has(self, query: str, allow_expired: bool = False) -> bool:
+        """Check if query is in cache and not expired (unless allow_expired)."""
         cache_key = self._get_cache_key(query)
         
         if cache_key not in self.metadata:
             return False
         
         # Check expiration
-        if self.max_age_days is not None:
+        if self.max_age_days is not None and not allow_expired:
             cached_time = datetime.fromisoformat(self.metadata[cache_key]['timestamp'])
             age = datetime.now() - cached_time
             if age > timedelta(days=self.max_age_days):
@@ -107,26 +182,35 @@ class LocalCache:
         cache_path = self._get_cache_path(cache_key)
         return cache_path.exists()
     
-    def get(self, query: str) -> Optional[pd.DataFrame]:
+    def get(self, query: str, allow_expired: bool = False) -> Optional[pd.DataFrame]:
         """
         Retrieve cached data for a query.
         
+        Args:
+            query: Query string
+            allow_expired: Also return entries older than max_age_days
+                          (e.g. to reuse them after revalidating with the API)
+        
         Returns:
             DataFrame if found, None if not in cache
         """
-        if not self.has(query):
+        if not self.has(query, allow_expired=allow_expired):
             return None
         
         cache_key = self._get_cache_key(query)
         cache_path = self._get_cache_path(cache_key)
         
         try:
-            if self.compression:
-                with gzip.open(cache_path, 'rb') as f:
-                    data = pickle.load(f)
+            meta = self.metadata[cache_key]
+            if meta.get('batch'):
+                data = self._load_batch(cache_path)[query]
+            elif self._is_json(cache_path):
+                data = _json_loads(self._read_file(cache_path))
             else:
-                with open(cache_path, 'rb') as f:
-                    data = pickle.load(f)
+                data = pickle.loads(self._read_file(cache_path))
+            
+            # Recorded in memory; persisted with the next metadata write
+            self.metadata[cache_key]['last_access'] = datetime.now().isoformat()
             
             logger.info(f"Cache hit for query: {query[:50]}")
             return data
@@ -135,54 +219,236 @@ class LocalCache:
             logger.error(f"Error reading cache: {e}")
             return None
     
-    def store(self, query: str, data: pd.DataFrame, **meta_kwargs):
+    def store(self, query: str, data: pd.DataFrame, priority: int = 1, **meta_kwargs):
         """
         Store data in cache.
         
         Args:
             query: Query string (used as key)
             data: DataFrame to cache
+            priority: Eviction priority; lower-priority entries are evicted first
+                     when the cache is over max_size_bytes (default: 1)
             **meta_kwargs: Additional metadata to store
         """
+        self._store_entry(
+            query,
+            lambda: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+            "pkl",
+            len(data),
+            priority,
+            meta_kwargs,
+        )
+    
+    def store_raw(self, query: str, obj: Any, priority: int = 1, **meta_kwargs):
+        """
+        Store JSON-serializable data (e.g. a decoded API response) in cache.
+        
+        Written as compressed JSON, which is much cheaper than wrapping
+        small results in a DataFrame and pickling it. Read back with
+        get_raw() (or get()).
+        
+        Args:
+            query: Query string (used as key)
+            obj: JSON-serializable data (dicts, lists, strings, numbers)
+            priority: Eviction priority (see store())
+            **meta_kwargs: Additional metadata to store
+        """
+        self._store_entry(query, lambda: _json_dumps(obj), "json", 1, priority, meta_kwargs)
+    
+    def get_raw(self, query: str) -> Optional[Any]:
+        """
+        Retrieve data stored with store_raw().
+        
+        Returns:
+            The stored object, None if not in cache
+        """
+        return self.get(query)
+    
+    def _store_entry(self, query: str, serialize, fmt: str, num_rows: int, priority: int, meta_kwargs: Dict[str, Any]):
+        """Write one cache file from serialize() and record its metadata."""
         cache_key = self._get_cache_key(query)
-        cache_path = self._get_cache_path(cache_key)
+        old_path = self._get_cache_path(cache_key) if cache_key in self.metadata else None
+        cache_path = self._new_cache_path(cache_key, fmt)
         
         try:
             # Save data
-            if self.compression:
-                with gzip.open(cache_path, 'wb') as f:
-                    pickle.dump(data, f)
-            else:
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(data, f)
+            self._write_file(cache_path, serialize())
+            
+            # Drop a previous copy stored in another format or in a batch file
+            if old_path is not None and old_path != cache_path:
+                self._remove_entry(cache_key)
+            elif cache_key in self.metadata:
+                self._total_size -= self._entry_size(cache_key)
             
             # Update metadata
             self.metadata[cache_key] = {
                 'query': query,
                 'timestamp': datetime.now().isoformat(),
-                'num_rows': len(data),
+                'num_rows': num_rows,
                 'cache_key': cache_key,
+                'file': cache_path.name,
+                'size_bytes': cache_path.stat().st_size,
+                'priority': priority,
                 **meta_kwargs
             }
+            self._total_size += self.metadata[cache_key]['size_bytes']
+            self._evict_if_needed(keep=cache_key)
             self._save_metadata()
             
-            logger.info(f"Cached {len(data)} rows for query: {query[:50]}")
+            logger.info(f"Cached {num_rows} rows for query: {query[:50]}")
         
         except Exception as e:
             logger.error(f"Error writing cache: {e}")
     
-    def delete(self, query: str):
-        """Remove a query from cache."""
-        cache_key = self._get_cache_key(query)
+    def store_many(self, items: Dict[str, Any], priority: int = 1, **meta_kwargs):
+        """
+        Store many entries in a single cache file.
+        
+        Much cheaper than calling store() for each of many small entries
+        (one compression and one file write in total). Entries are still
+        read, listed and deleted individually; the file is removed once
+        none of its entries are left.
+        
+        Args:
+            items: Dict mapping query string (used as key) to data
+            priority: Eviction priority for all entries (see store())
+            **meta_kwargs: Additional metadata to store with each entry
+        """
+        if not items:
+            return
+        
+        batch_hash = hashlib.md5("\n".join(items).encode()).hexdigest()[:16]
+        batch_path = self._new_cache_path(f"_batch_{batch_hash}")
+        cache_keys = {query: self._get_cache_key(query) for query in items}
+        
+        try:
+            self._write_file(batch_path, pickle.dumps(dict(items), protocol=pickle.HIGHEST_PROTOCOL))
+            if self._batch_memo is not None and self._batch_memo[0] == batch_path.name:
+                self._batch_memo = None
+            
+            # Drop previous copies of these entries
+            for cache_key in cache_keys.values():
+                if cache_key in self.metadata and self._get_cache_path(cache_key) != batch_path:
+                    self._remove_entry(cache_key)
+            
+            timestamp = datetime.now().isoformat()
+            entry_size = batch_path.stat().st_size // len(items)
+            for query, data in items.items():
+                cache_key = cache_keys[query]
+                if cache_key in self.metadata:
+                    self._total_size -= self._entry_size(cache_key)
+                self._total_size += entry_size
+                self.metadata[cache_key] = {
+                    'query': query,
+                    'timestamp': timestamp,
+                    'num_rows': len(data) if hasattr(data, '__len__') else 1,
+                    'cache_key': cache_key,
+                    'file': batch_path.name,
+                    'batch': True,
+                    'size_bytes': entry_size,
+                    'priority': priority,
+                    **meta_kwargs
+                }
+            self._evict_if_needed(keep=set(cache_keys.values()))
+            self._save_metadata()
+            
+            logger.info(f"Cached {len(items)} entries in {batch_path.name}")
+        
+        except Exception as e:
+            logger.error(f"Error writing cache: {e}")
+    
+    def _load_batch(self, path: Path) -> Dict[str, Any]:
+        """Read a batch file, reusing the last one read."""
+        if self._batch_memo is None or self._batch_memo[0] != path.name:
+            self._batch_memo = (path.name, pickle.loads(self._read_file(path)))
+        return self._batch_memo[1]
+    
+    def _remove_entry(self, cache_key: str):
+        """Remove a cache file and its metadata entry (metadata is not saved)."""
         cache_path = self._get_cache_path(cache_key)
+        meta = self.metadata.pop(cache_key, None)
+        if meta:
+            self._total_size -= meta.get('size_bytes', 0)
+        
+        # Batch files are shared; keep them while other entries use them
+        if meta and meta.get('batch'):
+            if any(other.get('file') == meta['file'] for other in self.metadata.values()):
+                return
+            if self._batch_memo is not None and self._batch_memo[0] == meta['file']:
+                self._batch_memo = None
         
         if cache_path.exists():
             cache_path.unlink()
+    
+    def _entry_size(self, cache_key: str) -> int:
+        """Size of a cache file in bytes, recorded in metadata on first use."""
+        meta = self.metadata[cache_key]
+        if 'size_bytes' not in meta:
+            cache_path = self._get_cache_path(cache_key)
+            meta['size_bytes'] = cache_path.stat().st_size if cache_path.exists() else 0
+        return meta['size_bytes']
+    
+    def _evict_if_needed(self, keep: Union[str, set, None] = None):
+        """
+        Evict entries until the cache fits in max_size_bytes.
+        
+        Lowest priority goes first; within a priority, least recently used
+        first (entries never read count from when they were stored).
+        Entries in keep (a cache key or a set of them) are never evicted.
+        """
+        if self.max_size_bytes is None:
+            return
         
-        if cache_key in self.metadata:
-            del self.metadata[cache_key]
+        if self._total_size <= self.max_size_bytes:
+            return
+        
+        if not isinstance(keep, set):
+            keep = {keep}
+        
+        def eviction_order(key):
+            meta = self.metadata[key]
+            return meta.get('priority', 1), meta.get('last_access', meta['timestamp'])
+        
+        candidates = sorted((key for key in self.metadata if key not in keep), key=eviction_order)
+        
+        evicted = 0
+        for cache_key in candidates:
+            if self._total_size <= self.max_size_bytes:
+                break
+            self._remove_entry(cache_key)
+            evicted += 1
+        
+        logger.info(f"Evicted {evicted} cache entries to stay within {self.max_size_bytes} bytes")
+    
+    def delete(self, query: str):
+        """Remove a query from cache."""
+        cache_key = self._get_cache_key(query)
+        
+        had_entry = cache_key in self.metadata
+        self._remove_entry(cache_key)
+        
+        if had_entry:
             self._save_metadata()
     
+    def get_metadata(self, query: str) -> Optional[Dict[str, Any]]:
+        """Metadata stored for a query (expired or not), None if not cached."""
+        return self.metadata.get(self._get_cache_key(query))
+    
+    def touch(self, query: str, **meta_kwargs):
+        """
+        Mark a cached entry as fresh without rewriting its data.
+        
+        Args:
+            query: Query string
+            **meta_kwargs: Metadata to update
+        """
+        meta = self.metadata.get(self._get_cache_key(query))
+        if meta is None:
+            return
+        meta['timestamp'] = datetime.now().isoformat()
+        meta.update(meta_kwargs)
+        self._save_metadata()
+    
     def list_queries(self) -> List[Dict[str, Any]]:
         """List all cached queries with metadata."""
         return list(self.metadata.values())
@@ -213,15 +479,19 @@ class LocalCache:
                 cache_path.unlink()
         
         self.metadata = {}
+        self._total_size = 0
+        self._batch_memo = None
         self._save_metadata()
         logger.info("Cleared all cache")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        # A set, since batch files hold several entries
+        cache_paths = {self._get_cache_path(key) for key in self.metadata.keys()}
         total_size = sum(
-            self._get_cache_path(key).stat().st_size 
-            for key in self.metadata.keys()
-            if self._get_cache_path(key).exists()
+            path.stat().st_size 
+            for path in cache_paths
+            if path.exists()
         )
         
         return {
@@ -10,18 +10,187 @@ Handles Scopus-specific:
 
 from pathlib import Path
 import yaml
+import asyncio
+import contextlib
 import datetime
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
-from urllib.parse import quote_plus
+from typing import Optional, Dict, List, Any, Tuple
+from dataclasses import dataclass, field
+from urllib.parse import quote_plus, urlencode
+import functools
 import logging
+import os
+import tempfile
+import threading
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .base_client import BaseAPIClient, APIConfig, RateLimiter, BaseSearchFetcher
+from .base_client import (
+    BaseAPIClient, APIConfig, RateLimiter, BaseSearchFetcher, StaleCacheMixin,
+    parse_json_response, _request_json_async,
+)
 from .local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
+# Use the LibYAML-backed loader when available; same safe semantics, much faster
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+# Transient statuses retried when fetching abstracts
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# msgpack is optional; used for a pre-compiled copy of scopus.yaml if present
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        return iterable
+
+
+# Process-wide limit on Scopus requests in flight (see set_max_concurrent_requests)
+_max_concurrent = 8
+_concurrency = threading.BoundedSemaphore(_max_concurrent)
+
+
+def set_max_concurrent_requests(max_concurrent: int):
+    """
+    Set how many Scopus requests may be in flight at once in this process.
+    
+    The limit is shared by all Scopus clients and fetchers, sync and async,
+    so together they stay within it (default: 8). Requests already in
+    flight finish under the previous limit.
+    
+    Args:
+        max_concurrent: Maximum number of concurrent Scopus requests
+    """
+    global _max_concurrent, _concurrency
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+    _max_concurrent = max_concurrent
+    _concurrency = threading.BoundedSemaphore(max_concurrent)
+
+
+@contextlib.asynccontextmanager
+async def _hold_async(semaphore: threading.BoundedSemaphore, poll_interval: float = 0.01):
+    """Hold a threading semaphore in a coroutine, polling instead of blocking the event loop."""
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(poll_interval)
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_key_file(path: str, mtime_ns: int) -> Optional[str]:
+    """
+    Parse a scopus.yaml file and return its API key (None if missing/empty).
+    
+    Cached on path and modification time, so the file is only re-parsed
+    after it changes. A msgpack copy written by compile_key_file() is
+    read instead when it is at least as new as the YAML file; if that
+    copy is unreadable or corrupt, the YAML file is parsed.
+    """
+    key_data = None
+    mp_path = path + '.mp'
+    if msgpack is not None and os.path.exists(mp_path):
+        try:
+            if os.stat(mp_path).st_mtime_ns >= mtime_ns:
+                with open(mp_path, 'rb') as f:
+                    key_data = msgpack.unpackb(f.read(), raw=False)
+        except (OSError, ValueError, msgpack.UnpackException) as e:
+            logger.warning(f"Ignoring unreadable {mp_path}: {e}")
+            key_data = None
+        if not isinstance(key_data, dict):
+            key_data = None
+    
+    if key_data is None:
+        with open(path, 'r') as f:
+            key_data = yaml.load(f, Loader=_YLoader)
+    
+    if key_data and 'X-ELS-APIKey' in key_data:
+        return key_data['X-ELS-APIKey'] or None
+    return None
+
+
+def compile_key_file(path: str = 'scopus.yaml') -> Path:
+    """
+    Write a msgpack copy of scopus.yaml (scopus.yaml.mp) next to it.
+    
+    Key loading then reads the msgpack copy, skipping YAML parsing, until
+    scopus.yaml is modified again. The copy holds the API key, so it is
+    readable by the owner only; it is written to a temporary file and
+    moved into place, so an existing copy never keeps looser permissions.
+    Requires: pip install msgpack
+    
+    Args:
+        path: Path to scopus.yaml
+    
+    Returns:
+        Path of the written .mp file
+    """
+    if msgpack is None:
+        raise ImportError("compile_key_file requires msgpack - install with: pip install msgpack")
+    
+    path = Path(path).expanduser()
+    with open(path, 'r') as f:
+        key_data = yaml.load(f, Loader=_YLoader)
+    
+    mp_path = path.with_name(path.name + '.mp')
+    # mkstemp creates the file with mode 0o600
+    fd, tmp_path = tempfile.mkstemp(dir=mp_path.parent, prefix=mp_path.name + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(msgpack.packb(key_data, use_bin_type=True))
+        os.replace(tmp_path, mp_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
+    logger.info(f"Wrote {mp_path}")
+    return mp_path
+
+
+def _load_scopus_key(api_key_dir: str) -> str:
+    """
+    Find scopus.yaml in the current directory or api_key_dir and return its API key.
+    
+    File: scopus.yaml with required 'X-ELS-APIKey' field
+    """
+    for path in (Path('scopus.yaml'), Path(api_key_dir).expanduser() / 'scopus.yaml'):
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        
+        try:
+            api_key = _read_key_file(os.path.abspath(path), mtime_ns)
+        except Exception as e:
+            logger.warning(f"Error loading {path}: {e}")
+            continue
+        
+        if api_key:
+            logger.info(f"Loaded Scopus API key from {path}")
+            return api_key
+    
+    raise FileNotFoundError(
+        f"Scopus API key not found. Create one of:\n"
+        f"  - ./scopus.yaml\n"
+        f"  - {Path(api_key_dir).expanduser()}/scopus.yaml\n\n"
+        f"With content:\n"
+        f"  X-ELS-APIKey: your_api_key_here\n\n"
+        f"Get your API key from: https://dev.elsevier.com/"
+    )
+
 
 @dataclass
 class ScopusConfig(APIConfig):
@@ -35,15 +204,20 @@ class ScopusConfig(APIConfig):
     burst_size: int = 5
     max_results_per_query: int = 5000
     
+    default_params: Dict[str, Any] = field(default_factory=lambda: {'count': 25})
+    
     def __post_init__(self):
-        super().__post_init__()
-        if not self.default_params:
+        # Passing None keeps meaning the Scopus defaults
+        if self.default_params is None:
             self.default_params = {'count': 25}
+        super().__post_init__()
 
 
 class ScopusRateLimiter(RateLimiter):
     """Scopus-specific rate limiter that reads X-RateLimit headers."""
     
+    __slots__ = ()
+    
     def update_from_headers(self, headers: Dict[str, str]):
         """Update rate limit state from Scopus API headers."""
         try:
@@ -54,7 +228,6 @@ class ScopusRateLimiter(RateLimiter):
                 if self.api_remaining % 100 == 0:
                     logger.info(f"Scopus API rate limit: {self.api_remaining}/{self.api_rate_limit} remaining")
             if 'X-RateLimit-Reset' in headers:
-                import datetime
                 self.api_reset_time = datetime.datetime.fromtimestamp(int(headers['X-RateLimit-Reset']))
         except (ValueError, KeyError) as e:
             logger.warning(f"Error parsing Scopus rate limit headers: {e}")
@@ -65,8 +238,23 @@ class ScopusSearchClient(BaseAPIClient):
     
     def __init__(self, config: ScopusConfig):
         self.config = config
-        self.rate_limiter = ScopusRateLimiter(config)  # Use Scopus-specific rate limiter
+        # Everything after the query is fixed unless extra params are passed
+        self._static_suffix = f"&{urlencode({'view': config.view, **config.default_params})}"
         super().__init__(config)
+        # Set after super().__init__, which installs a generic RateLimiter
+        self.rate_limiter = ScopusRateLimiter(config)
+    
+    def _send(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Send a request, waiting if too many Scopus requests are in flight."""
+        with _concurrency:
+            return super()._send(url, headers)
+    
+    async def _make_request_async(self, session, url: str) -> Optional[Any]:
+        """Async request, waiting (without blocking the loop) if too many Scopus requests are in flight."""
+        return await _request_json_async(
+            session, url, self.config, self.rate_limiter,
+            request_slot=lambda: _hold_async(_concurrency)
+        )
     
     def _setup_session(self):
         """Setup Scopus session with API key."""
@@ -79,13 +267,16 @@ class ScopusSearchClient(BaseAPIClient):
             'Accept': 'application/json',
             'X-ELS-APIKey': self.config.api_key,
         })
-        print (self.session.headers)
+        logger.debug(f"Scopus session headers set (API key=***{self.config.api_key[-4:]})")
     
     def _build_search_url(self, query: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Build Scopus search URL."""
-        url_params = {**self.config.default_params, **(params or {})}
-        param_str = '&'.join(f'{k}={v}' for k, v in url_params.items())
-        return f"{self.config.base_url}?query={quote_plus(query)}&view={self.config.view}&{param_str}"
+        # Common case: no extra params, only the query varies
+        if not params:
+            return f"{self.config.base_url}?query={quote_plus(query)}{self._static_suffix}"
+        
+        url_params = {'view': self.config.view, **self.config.default_params, **params}
+        return f"{self.config.base_url}?query={quote_plus(query)}&{urlencode(url_params)}"
     
     def _parse_page_response(self, response_data: Dict[str, Any], page: int) -> Dict[str, Any]:
         """Parse Scopus API response."""
@@ -99,7 +290,8 @@ class ScopusSearchClient(BaseAPIClient):
             }
         
         # Check for search results
-        if 'search-results' not in response_data:
+        search_results = response_data.get('search-results')
+        if search_results is None:
             return {
                 'page': page,
                 'total_results': 0,
@@ -107,9 +299,8 @@ class ScopusSearchClient(BaseAPIClient):
                 'error': 'no_search_results'
             }
         
-        search_results = response_data['search-results']
-        total_results = int(search_results.get('opensearch:totalResults', 0))
-        entries = search_results.get('entry', [])
+        total_results = int(search_results.get('opensearch:totalResults') or 0)
+        entries = search_results.get('entry') or []
         
         return {
             'page': page,
@@ -123,13 +314,10 @@ class ScopusSearchClient(BaseAPIClient):
         if 'search-results' not in response_data:
             return None
         
-        links = response_data['search-results'].get('link', [])
-        next_links = [link for link in links if link.get('@ref') == 'next']
+        links = response_data['search-results'].get('link') or ()
+        next_link = next((link for link in links if link.get('@ref') == 'next'), None)
         
-        if next_links:
-            return next_links[0]['@href']
-        
-        return None
+        return next_link['@href'] if next_link else None
 
 
 class ScopusSearchFetcher(BaseSearchFetcher):
@@ -189,44 +377,23 @@ class ScopusSearchFetcher(BaseSearchFetcher):
         
         File: scopus.yaml with required 'X-ELS-APIKey' field
         """
-        import yaml
-        
-        api_key_dir = Path(api_key_dir).expanduser()
-        key_paths = [
-            Path('.') / 'scopus.yaml',
-            api_key_dir / 'scopus.yaml',
-        ]
-        
-        for path in key_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        key_data = yaml.safe_load(f)
-                        
-                        if key_data and 'X-ELS-APIKey' in key_data:
-                            api_key = key_data['X-ELS-APIKey']
-                            if api_key:  # Make sure it's not empty
-                                logger.info(f"Loaded Scopus API key from {path}")
-                                return api_key
-                except Exception as e:
-                    logger.warning(f"Error loading {path}: {e}")
-        
-        raise FileNotFoundError(
-            f"Scopus API key not found. Create one of:\n"
-            f"  - ./scopus.yaml\n"
-            f"  - {api_key_dir}/scopus.yaml\n\n"
-            f"With content:\n"
-            f"  X-ELS-APIKey: your_api_key_here\n\n"
-            f"Get your API key from: https://dev.elsevier.com/"
-        )
+        return _load_scopus_key(api_key_dir)
     
-    def fetch(self, query: str, force_refresh: bool = False, **params) -> Optional[pd.DataFrame]:
+    def fetch(
+        self,
+        query: str,
+        force_refresh: bool = False,
+        stale_ok: bool = True,
+        **params
+    ) -> Optional[pd.DataFrame]:
         """
         Fetch Scopus search results with optional parameters.
         
         Args:
             query: Scopus search query string
             force_refresh: If True, bypass cache
+            stale_ok: If True, return expired cached results when Scopus
+                     fails with 5xx or can't be reached (default: True)
             **params: Additional Scopus API parameters
         
         Common Query Fields:
@@ -294,29 +461,106 @@ class ScopusSearchFetcher(BaseSearchFetcher):
             https://dev.elsevier.com/guides/ScopusSearchGuide.pdf
         """
         # Use base fetch with params
-        return super().fetch(query, force_refresh=force_refresh, **params)
+        return super().fetch(query, force_refresh=force_refresh, stale_ok=stale_ok, **params)
+    
+    async def afetch_all(self, queries: List[str], force_refresh: bool = False, **params) -> pd.DataFrame:
+        """
+        Fetch several queries concurrently (requires: pip install aiohttp).
+        
+        Pages of one query are still fetched in order, but different queries
+        overlap, so the batch is bounded by the rate limit rather than by
+        request round trips. All queries share the client's rate limiter.
+        Like fetch(), a query is cached only if all its pages were fetched;
+        queries that fail are logged and left out of the result.
+        
+        Args:
+            queries: List of Scopus query strings
+            force_refresh: If True, bypass cache
+            **params: Additional Scopus API parameters, applied to every query
+        
+        Returns:
+            DataFrame with the results of all queries (same columns as fetch())
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("afetch_all requires aiohttp - install with: pip install aiohttp")
+        
+        results = {}
+        to_fetch = []
+        for query in dict.fromkeys(queries):
+            cached = None if force_refresh else self.cache.get(self._make_cache_key(query, params))
+            if cached is not None:
+                results[query] = cached
+            else:
+                to_fetch.append(query)
+        
+        if to_fetch:
+            logger.info(f"Fetching {len(to_fetch)} queries...")
+            # Each query pages sequentially, so this bounds requests in flight
+            semaphore = asyncio.Semaphore(_max_concurrent)
+            
+            async def fetch_query(session, query):
+                async with semaphore:
+                    return await self.client.fetch_async(query, params or None, session=session)
+            
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=8)
+            async with aiohttp.ClientSession(headers=dict(self.client.session.headers), connector=connector) as session:
+                # One failing query (e.g. 401) must not discard the others
+                fetched = await asyncio.gather(
+                    *(fetch_query(session, query) for query in to_fetch),
+                    return_exceptions=True
+                )
+            
+            for query, pages in zip(to_fetch, fetched):
+                if isinstance(pages, Exception):
+                    logger.error(f"Error fetching query {query[:50]}: {pages!r}")
+                    continue
+                if not pages:
+                    logger.warning(f"No results for query: {query[:50]}")
+                    continue
+                if pages[-1].get('error') == 'request_failed':
+                    # Partial results are discarded rather than cached
+                    logger.error(f"Error fetching query: {query[:50]}")
+                    continue
+                
+                cache_key = self._make_cache_key(query, params)
+                results[query] = self._store_pages(cache_key, [self._page_row(cache_key, page) for page in pages])
+        
+        frames = [results[query] for query in queries if query in results]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
     
     def clean_max_hits(self):
         """Remove cached queries that exceeded max_hits."""
+        max_hits = self.client.config.max_results_per_query
         removed = 0
         for item in self.cache.list_queries():
-            data = self.cache.get(item['query'])
-            if data is not None:
+            if 'max_null_data_hits' in item:
+                # Decide from the metadata recorded by fetch()
+                problematic = item['max_null_data_hits'] > max_hits
+            else:
+                # Older entries lack the summary; load the data to check
+                data = self.cache.get(item['query'])
+                if data is None:
+                    continue
                 # Check if any row has data=None and num_hits > max_hits
-                problematic = data[
+                problematic = (
                     (data['data'].isna()) & 
-                    (data['num_hits'] > self.client.config.max_results_per_query)
-                ]
-                if len(problematic) > 0:
-                    self.cache.delete(item['query'])
-                    removed += 1
+                    (data['num_hits'] > max_hits)
+                ).any()
+            
+            if problematic:
+                self.cache.delete(item['query'])
+                removed += 1
         
         if removed > 0:
             logger.info(f"Removed {removed} queries that exceeded max_hits")
 
 
 # Keep the old class names for backward compatibility
-class ScopusAbstractFetcher:
+class ScopusAbstractFetcher(StaleCacheMixin):
     """
     Fetcher for individual Scopus abstracts by EID.
     
@@ -324,18 +568,22 @@ class ScopusAbstractFetcher:
     consider extending BaseAPIClient similarly to ScopusSearchClient.
     """
     
+    # Abstracts fetched by provide() are cached in batch files of this many entries
+    cache_batch_size = 200
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         cache_dir: str = "~/.cache/scopus/abstracts",
+        api_key_dir: str = "~/Documents/dh4pmp/api_keys",
         **kwargs
     ):
         """Initialize abstract fetcher."""
-        import requests
+        super().__init__()
         
         # Load API key
         if api_key is None:
-            api_key = self._load_api_key()
+            api_key = self._load_api_key(api_key_dir)
         
         self.base_url = 'https://api.elsevier.com/content/abstract/eid'
         self.api_key = api_key
@@ -345,78 +593,238 @@ class ScopusAbstractFetcher:
             max_age_days=kwargs.get('cache_max_age_days', None)
         )
         
-        # Rate limiting
+        # Rate limiting - token bucket, adjusted by X-RateLimit headers
         self.requests_per_second = kwargs.get('requests_per_second', 2.0)
-        self.sleep_time = 1.0 / self.requests_per_second
+        # Retry policy matches the session's urllib3 Retry below (used by aprovide)
+        self.config = ScopusConfig(
+            api_key=api_key,
+            requests_per_second=self.requests_per_second,
+            max_retries=3,
+            initial_retry_delay=0.5,
+        )
+        self.rate_limiter = ScopusRateLimiter(self.config)
+        
+        # Shared session so bulk fetches reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'X-ELS-APIKey': self.api_key,
+        })
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=_RETRY_STATUSES),
+        )
+        self.session.mount('https://', adapter)
     
-    def _load_api_key(self) -> str:
+    def _load_api_key(self, api_key_dir: str = "~/Documents/dh4pmp/api_keys") -> str:
         """Load API key from yaml file."""
-        key_paths = [
-            Path('.') / 'scopus.yaml',
-            Path('~/Documents/dh4pmp/api_keys').expanduser() / 'scopus.yaml',
-        ]
-        
-        for path in key_paths:
-            if path.exists():
-                with open(path, 'r') as f:
-                    key_data = yaml.safe_load(f)
-                    if key_data and 'X-ELS-APIKey' in key_data:
-                        return key_data['X-ELS-APIKey']
-        
-        raise FileNotFoundError("Scopus API key file not found")
-    
-    def fetch(self, eid: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
-        """Fetch abstract data for an EID."""
-        import requests
-        import time
-        import pandas as pd
+        return _load_scopus_key(api_key_dir)
+    
+    def fetch(self, eid: str, force_refresh: bool = False, stale_ok: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Fetch abstract data for an EID.
         
+        Args:
+            eid: Scopus EID
+            force_refresh: If True, bypass cache
+            stale_ok: If True, return an expired cached abstract when Scopus
+                     fails (5xx or no response after retries), and don't ask
+                     Scopus again for this EID for stale_seconds (default: True)
+        """
         # Check cache
         if not force_refresh:
-            cached = self.cache.get(eid)
-            if cached is not None and len(cached) > 0:
-                return cached.iloc[0]['data']
+            cached = self._get_cached(eid)
+            if cached is not None:
+                return cached
+            
+            # Scopus failed for this EID recently; don't hammer it
+            if stale_ok:
+                cached = self._recent_stale(eid)
+                if cached is not None:
+                    return cached
         
-        # Fetch from API
+        data, status = self._fetch_remote(eid)
+        if data is not None:
+            self._cache_abstract(eid, data)
+        elif stale_ok:
+            data = self._serve_stale_after(eid, status)
+        return data
+    
+    def _fetch_remote(self, eid: str) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        Fetch abstract data for an EID from the API, without caching it.
+        
+        Returns:
+            (data, status) - data is None on failure; status is the HTTP
+            status, or None if no response was received (connection error,
+            or retries of 429/5xx exhausted)
+        """
         url = f'{self.base_url}/{eid}?view=META_ABS'
-        headers = {
-            'Accept': 'application/json',
-            'X-ELS-APIKey': self.api_key,
-        }
         
         try:
-            r = requests.get(url, headers=headers, timeout=30)
-            time.sleep(self.sleep_time)
-            
-            if r.ok:
-                data = r.json()
-                
-                # Cache it
-                df = pd.DataFrame([{
-                    'ID': eid,
-                    'data': data
-                }])
-                self.cache.store(eid, df)
-                
-                return data
-            else:
-                logger.error(f"Error {r.status_code} fetching {eid}")
+            self.rate_limiter.wait_if_needed()
+            with _concurrency:
+                r = self.session.get(url, timeout=30)
+            self.rate_limiter.update_from_headers(r.headers)
+        except requests.RequestException as e:
+            logger.error(f"Exception fetching {eid}: {e}")
+            return None, None
+        
+        if not r.ok:
+            logger.error(f"Error {r.status_code} fetching {eid}")
+            return None, r.status_code
+        
+        try:
+            return parse_json_response(r), r.status_code
+        except ValueError as e:
+            logger.error(f"Invalid JSON response for {eid}: {e}")
+            return None, r.status_code
+    
+    def _get_stale(self, eid: str) -> Optional[Dict[str, Any]]:
+        """Cached abstract data for an EID, expired or not."""
+        return self._get_cached(eid, allow_expired=True)
+    
+    def _get_cached(self, eid: str, allow_expired: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get cached abstract data for an EID.
+        
+        Handles plain dicts (written by fetch() and provide()) as well as
+        the one-row DataFrames older versions stored.
+        """
+        cached = self.cache.get(eid, allow_expired=allow_expired)
+        if isinstance(cached, pd.DataFrame):
+            return cached.iloc[0]['data'] if len(cached) > 0 else None
+        return cached
+    
+    def _cache_abstract(self, eid: str, data: Dict[str, Any]):
+        """Store one abstract in the cache."""
+        self.cache.store_raw(eid, data)
+    
+    def _cache_abstracts(self, abstracts: Dict[str, Dict[str, Any]]):
+        """Store many abstracts in the cache, cache_batch_size per file."""
+        items = list(abstracts.items())
+        for start in range(0, len(items), self.cache_batch_size):
+            self.cache.store_many(dict(items[start:start + self.cache_batch_size]))
+    
+    async def _afetch(self, session, eid: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one abstract with aiohttp; returns the decoded JSON or None on failure.
+        
+        429 and 5xx responses are retried with backoff, like the sync session.
+        """
+        url = f'{self.base_url}/{eid}?view=META_ABS'
+        async with semaphore:
+            try:
+                return await _request_json_async(
+                    session, url, self.config, self.rate_limiter, retry_statuses=_RETRY_STATUSES,
+                    request_slot=lambda: _hold_async(_concurrency)
+                )
+            except RuntimeError as e:
+                logger.error(f"Exception fetching {eid}: {e}")
                 return None
+    
+    async def aprovide(self, eids: List[str], force_refresh: bool = False, max_concurrent: Optional[int] = None) -> pd.DataFrame:
+        """
+        Fetch multiple EIDs concurrently (requires: pip install aiohttp).
         
-        except Exception as e:
-            logger.error(f"Exception fetching {eid}: {e}")
-            return None
+        Requests overlap, so throughput is bounded by requests_per_second
+        rather than by the round trip time of each request. Cache reads and
+        writes happen on the calling thread. Progress is shown as requests
+        complete.
+        
+        Args:
+            eids: List of Scopus EIDs
+            force_refresh: If True, bypass cache
+            max_concurrent: Maximum number of requests in flight; can't
+                           exceed the process-wide limit set with
+                           set_max_concurrent_requests() (default: that limit)
+        
+        Returns:
+            DataFrame with 'ID' and 'data' columns, in the order of eids
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aprovide requires aiohttp - install with: pip install aiohttp")
+        
+        found = {}
+        if not force_refresh:
+            for eid in eids:
+                cached = self._get_cached(eid)
+                if cached is not None:
+                    found[eid] = cached
+        
+        missing = [eid for eid in dict.fromkeys(eids) if eid not in found]
+        if missing:
+            logger.info(f"Fetching {len(missing)} abstracts...")
+            if max_concurrent and max_concurrent > _max_concurrent:
+                logger.warning(
+                    f"max_concurrent={max_concurrent} exceeds the process-wide Scopus limit "
+                    f"of {_max_concurrent}; raise it with set_max_concurrent_requests()"
+                )
+            max_concurrent = min(max_concurrent or _max_concurrent, _max_concurrent)
+            semaphore = asyncio.Semaphore(max_concurrent)
+            headers = {
+                'Accept': 'application/json',
+                'X-ELS-APIKey': self.api_key,
+            }
+            connector = aiohttp.TCPConnector(limit_per_host=max_concurrent)
+            async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+                async def fetch_one(eid):
+                    return eid, await self._afetch(session, eid, semaphore)
+                
+                new = {}
+                done = asyncio.as_completed([fetch_one(eid) for eid in missing])
+                for next_done in tqdm(done, total=len(missing), desc="Fetching abstracts"):
+                    eid, data = await next_done
+                    if data is not None:
+                        new[eid] = data
+            
+            self._cache_abstracts(new)
+            found.update(new)
+        
+        return pd.DataFrame.from_records([{'ID': eid, 'data': found[eid]} for eid in eids if eid in found])
     
     def provide(self, eids: List[str], force_refresh: bool = False) -> pd.DataFrame:
-        """Fetch multiple EIDs."""
-        from tqdm import tqdm
-        import pandas as pd
+        """
+        Fetch multiple EIDs.
+        
+        Uses aprovide() when aiohttp is installed and no event loop is
+        running; otherwise fetches one EID at a time.
+        """
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+        
+        if not in_event_loop:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError:
+                pass
+            else:
+                return asyncio.run(self.aprovide(eids, force_refresh=force_refresh))
         
         results = []
+        pending = {}
         
-        for eid in tqdm(eids, desc="Fetching abstracts"):
-            data = self.fetch(eid, force_refresh=force_refresh)
-            if data is not None:
-                results.append({'ID': eid, 'data': data})
+        try:
+            for eid in tqdm(eids, desc="Fetching abstracts"):
+                data = None if force_refresh else self._get_cached(eid)
+                if data is None:
+                    data = pending.get(eid) or self._fetch_remote(eid)[0]
+                    if data is not None:
+                        pending[eid] = data
+                if data is not None:
+                    results.append({'ID': eid, 'data': data})
+                
+                if len(pending) >= self.cache_batch_size:
+                    self._cache_abstracts(pending)
+                    pending = {}
+        finally:
+            # Keep what was fetched even if interrupted
+            self._cache_abstracts(pending)
         
-        return pd.DataFrame(results)
+        return pd.DataFrame.from_records(results)
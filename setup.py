@@ -33,6 +33,14 @@ setup(
         "tqdm>=4.60.0",  # Progress bars (works in terminal and Jupyter)
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0.0",  # Faster JSON decoding of API responses
+            "zstandard>=0.15.0",  # Faster cache compression
+            "msgpack>=1.0.0",  # Pre-compiled API key files (compile_key_file)
+        ],
+        "async": [
+            "aiohttp>=3.8.0",  # Async fetching (fetch_async)
+        ],
         "dev": [
             "jupyter>=1.0.0",  # For testing in notebooks
         ],